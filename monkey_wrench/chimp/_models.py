@@ -1,4 +1,3 @@
-import tempfile
 from pathlib import Path
 from typing import Callable, Literal
 from uuid import uuid4
@@ -11,6 +10,7 @@ from monkey_wrench.generic import Pattern
 from monkey_wrench.input_output import (
     DateTimeDirectory,
     ModelFile,
+    TempDirectory,
     copy_files_between_directories,
 )
 from monkey_wrench.input_output.seviri import output_filename_from_datetime, seviri_extension_context
@@ -19,7 +19,8 @@ from monkey_wrench.query import List
 
 class ChimpRetrieval(
     DateTimeDirectory,
-    ModelFile
+    ModelFile,
+    TempDirectory
 ):
     """Pydantic model for CHIMP retrievals."""
     device: Literal["cpu", "cuda"] = "cpu"
@@ -63,7 +64,7 @@ class ChimpRetrieval(
     def __run_for_single_batch(self, batch: list[FilePath], retrieve_function: Callable) -> None:
         """Helper function to perform a single CHIMP retrieval for a single batch."""
         log_id = uuid4()
-        with tempfile.TemporaryDirectory(prefix=f"chimp_{log_id}_") as tmp_dir:
+        with self.make_temporary_directory(prefix=f"chimp_{log_id}_") as tmp_dir:
             input_filepaths = self.__input_filepaths_as_strings(batch)
 
             retrieve_function(
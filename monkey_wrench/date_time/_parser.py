@@ -1,5 +1,7 @@
+import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Generator, Never
 from zoneinfo import ZoneInfo
 
@@ -7,6 +9,9 @@ from pydantic import validate_call
 
 from monkey_wrench.generic import ListSetTuple, PathLikeType, apply_to_single_or_collection
 
+UTC = ZoneInfo("UTC")
+"""The default timezone of the parsed datetime objects."""
+
 
 class DateTimeParserBase:
     """A static base class for parsing items, e.g. product IDs or file paths, into datetime objects."""
@@ -44,9 +49,17 @@ class DateTimeParserBase:
         if timezone is None:
             timezone = ZoneInfo("UTC")
 
+        return DateTimeParserBase._parse_by_compiled_regex(item, re.compile(regex), timezone)
+
+    @staticmethod
+    def _parse_by_compiled_regex(item: str, regex: re.Pattern[str], timezone: ZoneInfo = UTC) -> datetime:
+        """Similar to :func:`parse_by_regex`, but with an already compiled regular expression and without validation.
+
+        This is meant to be used when parsing many items, e.g. in :func:`parse_collection`.
+        """
         try:
-            if match := re.search(regex, item):
-                return datetime(*[int(m) for m in match.groups()], tzinfo=timezone)
+            if match := regex.search(item):
+                return datetime(*map(int, match.groups()), tzinfo=timezone)
             raise ValueError()
         except ValueError:
             DateTimeParserBase._raise_value_error(item)
@@ -98,8 +111,17 @@ class DateTimeParserBase:
         Returns:
             A collection of datetime objects. The type of collection matches the type of the input collection, e.g.
             a list as input results in a list of datetime objects.
+
+        Note:
+            Derived classes can override :func:`_parse_item` to skip the validation of each single item, which is
+            otherwise performed by :func:`parse`.
         """
-        return apply_to_single_or_collection(cls.parse, items)
+        return apply_to_single_or_collection(cls._parse_item, items)
+
+    @classmethod
+    def _parse_item(cls, item: Any) -> Any:
+        """Parse a single item of a collection. Defaults to :func:`parse`."""
+        return cls.parse(item)
 
     @staticmethod
     def parse(item: Any) -> Any:
@@ -116,6 +138,7 @@ class SeviriIDParser(DateTimeParserBase):
 
     regex = (r"[0-9A-Za-z]+-SEVI-[0-9A-Za-z]+-[0-9]+-NA"
              r"-([0-9]{4})([0-9]{2})([0-9]{2})([0-9]{2})([0-9]{2})[0-9]{2}\.[0-9]+Z-NA")
+    compiled_regex = re.compile(regex)
 
     @staticmethod
     @validate_call
@@ -126,13 +149,25 @@ class SeviriIDParser(DateTimeParserBase):
             >>> SeviriIDParser.parse("MSG3-SEVI-MSG15-0100-NA-20150731221240.036000000Z-NA")
             datetime.datetime(2015, 7, 31, 22, 12, tzinfo=zoneinfo.ZoneInfo(key='UTC'))
         """
-        return DateTimeParserBase.parse_by_regex(seviri_product_id, SeviriIDParser.regex)
+        return SeviriIDParser._parse_item(seviri_product_id)
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _parse_item(seviri_product_id: str) -> datetime:
+        """Parse a single SEVIRI product ID of a collection, without validation and using the compiled regex.
+
+        Note:
+            The same product IDs are often parsed repeatedly, e.g. to query them and then to generate filenames. Since
+            datetime objects are immutable, the results are cached.
+        """
+        return DateTimeParserBase._parse_by_compiled_regex(seviri_product_id, SeviriIDParser.compiled_regex)
 
 
 class ChimpFilePathParser(DateTimeParserBase):
     """Static parser class for CHIMP-compiliant input and output file paths."""
 
     regex = r"[0-9A-Za-z]+_([0-9]{4})([0-9]{2})([0-9]{2})_([0-9]{2})_([0-9]{2})"
+    compiled_regex = re.compile(regex)
 
     @staticmethod
     @validate_call
@@ -175,12 +210,24 @@ class ChimpFilePathParser(DateTimeParserBase):
             >>> # Input is invalid (empty prefix). The following will raise an exception!
             >>> # FilePathParser.parse("_20150731_22_12")
         """
-        return DateTimeParserBase.parse_by_regex(str(filepath.stem), ChimpFilePathParser.regex)
+        return DateTimeParserBase._parse_by_compiled_regex(str(filepath.stem), ChimpFilePathParser.compiled_regex)
+
+    @staticmethod
+    def _parse_item(filepath: str | os.PathLike) -> datetime:
+        """Parse a single filepath of a collection, without validation and using the compiled regex.
+
+        The stem of the filepath is computed using string operations, i.e. without making a ``Path`` object.
+        """
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        return DateTimeParserBase._parse_by_compiled_regex(stem, ChimpFilePathParser.compiled_regex)
 
 
 class HritFilePathParser(DateTimeParserBase):
     """Static parser class for HRIT file paths."""
 
+    regex = r"\A([0-9]{4})([0-9]{2})([0-9]{2})([0-9]{2})([0-9]{2})\Z"
+    compiled_regex = re.compile(regex)
+
     @staticmethod
     @validate_call
     def parse(filepath: PathLikeType) -> datetime:
@@ -212,7 +259,20 @@ class HritFilePathParser(DateTimeParserBase):
             >>> # Input is invalid as it misses the mandatory trailing `-__`. The following will raise an exception!
             >>> # HritFilePathParser.parse(Path("202503041900"))
         """
-        return DateTimeParserBase.parse_by_format_string(str(filepath.stem)[-15:-3], "%Y%m%d%H%M")
+        datetime_string = str(filepath.stem)[-15:-3]
+        return DateTimeParserBase._parse_by_compiled_regex(datetime_string, HritFilePathParser.compiled_regex)
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _parse_item(filepath: str | os.PathLike) -> datetime:
+        """Parse a single filepath of a collection, without validation and without making a ``Path`` object.
+
+        Note:
+            Similar to :func:`SeviriIDParser._parse_item`, the results are cached, as the same HRIT files are often
+            collected repeatedly, e.g. from the same directory.
+        """
+        stem = os.path.splitext(os.path.basename(filepath))[0]
+        return DateTimeParserBase._parse_by_compiled_regex(stem[-15:-3], HritFilePathParser.compiled_regex)
 
 
 DateTimeParser = SeviriIDParser | ChimpFilePathParser | HritFilePathParser
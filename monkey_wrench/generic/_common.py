@@ -38,7 +38,6 @@ def assert_(item: T, message: str, exception: type[Exception] = ValueError, sile
     raise exception(message)
 
 
-@validate_call
 def apply_to_single_or_collection(
         function: Callable[[T], R],
         single_or_collection: dict[Any, T] | ListSetTuple[T] | T
@@ -51,6 +50,11 @@ def apply_to_single_or_collection(
     Warning:
         A string, although being a collection, is treated as a single item.
 
+    Note:
+        This function is not decorated with ``validate_call``, as it is called with (potentially very large)
+        collections in hot paths, e.g. parsing product IDs. Validating the arguments would copy the whole collection
+        without any effect on the result, since the elements can be of any type.
+
     Args:
         function:
             The function to be applied.
@@ -1,4 +1,6 @@
-from typing import Any, Callable, Iterable, TypeVar, assert_never, cast
+import re
+from functools import cached_property
+from typing import Any, Callable, TypeVar, assert_never, cast
 
 from pydantic import validate_call
 
@@ -54,6 +56,43 @@ class StringTransformation[OriginalType, TransformedType](Model):
             apply_to_single_or_collection(self._trim_item, items)
         )
 
+    def _trim_and_transform_item(self, item: OriginalType) -> OriginalType | TransformedType:
+        """Trim and then transform a single item."""
+        item = str(item).strip() if self.trim else str(item)
+        return self.transform_function(item) if self.transform_function is not None else item
+
+    def _trim_and_transform_sequence(
+            self, items: list[OriginalType] | tuple[OriginalType, ...]
+    ) -> list[TransformedType] | list[str] | tuple[TransformedType, ...] | tuple[str, ...]:
+        """Trim and then transform all items of a list/tuple.
+
+        Whether to trim and whether to transform are decided once for all items. The items are then processed by a chain
+        of built-in ``map()`` calls, i.e. without an additional Python function call per item.
+        """
+        results = map(str.strip, map(str, items)) if self.trim else map(str, items)
+        results = results if self.transform_function is None else map(self.transform_function, results)
+        return list(results) if isinstance(items, list) else tuple(results)
+
+    def trim_and_transform_items(
+            self, items: ListSetTuple[OriginalType] | OriginalType
+    ) -> ListSetTuple[TransformedType] | ListSetTuple[str] | TransformedType | str:
+        """Trim and then transform a single or multiple items in a single pass.
+
+        This is equivalent to calling :func:`trim_items` followed by :func:`transform_items`. Unlike those, this
+        method is not decorated with ``validate_call``, as it is meant for large collections of already known items,
+        e.g. the lines read from a file.
+
+        Examples:
+            >>> StringTransformation(transform_function=str.upper).trim_and_transform_items([" a ", "b "])
+            ['A', 'B']
+        """
+        if isinstance(items, list | tuple):
+            return self._trim_and_transform_sequence(items)
+        return cast(
+            ListSetTuple[TransformedType] | ListSetTuple[str] | TransformedType | str,
+            apply_to_single_or_collection(self._trim_and_transform_item, items)
+        )
+
 
 class Pattern(Model):
     """Pydantic model for finding sub-strings in other strings."""
@@ -81,15 +120,6 @@ class Pattern(Model):
     have any effect.
     """
 
-    @property
-    def pattern(self) -> "Pattern":
-        return Pattern(
-            sub_strings=self.sub_strings,
-            case_sensitive=self.case_sensitive,
-            match_all=self.match_all,
-            negate=self.negate
-        )
-
     @property
     def sub_strings_list(self) -> list[str]:
         """Enclose ``sub_strings`` in a list, if there is only a single sub-string."""
@@ -103,10 +133,49 @@ class Pattern(Model):
             case _:
                 assert_never(self.sub_strings)
 
+    @cached_property
+    def _regex(self) -> re.Pattern[str] | None:
+        """Return the compiled regular expression equivalent to the sub-strings, or ``None`` if there are none.
+
+        Note:
+            The regular expression is compiled only once per instance. In the case of a case-insensitive pattern, the
+            sub-strings are lower-cased and therefore, the strings need to be lower-cased as well before the search.
+        """
+        if self.sub_strings is None:
+            return None
+
+        sub_strings = [re.escape(s if self.case_sensitive else s.lower()) for s in self.sub_strings_list]
+        if self.match_all:
+            regex = r"\A" + "".join(f"(?=.*?{s})" for s in sub_strings)
+        else:
+            regex = "|".join(sub_strings) if sub_strings else r"(?!)"
+        return re.compile(regex, re.DOTALL)
+
     @property
-    def match_function(self) -> Callable[[Iterable[object]], bool]:
-        """Return either ``all()`` or ``any()`` built-in function depending on :attr:`Pattern.match_all`."""
-        return all if self.match_all else any
+    def matcher(self) -> Callable[[str], bool]:
+        """Return a function which is equivalent to :func:`check` for strings, using a precompiled regular expression.
+
+        This is useful when many strings need to be checked against the same pattern, e.g. when visiting the files in
+        a directory tree, since the sub-strings are processed only once and no validation is performed per string.
+
+        Examples:
+            >>> matcher = Pattern(sub_strings=["A", "b"], match_all=True, case_sensitive=False).matcher
+            >>> matcher("abcde")
+            True
+
+            >>> matcher("bcde")
+            False
+        """
+        negate = self.negate
+
+        if self._regex is None:
+            return lambda _: True ^ negate
+
+        search = self._regex.search
+
+        if self.case_sensitive:
+            return lambda item: (search(item) is not None) ^ negate
+        return lambda item: (search(item.lower()) is not None) ^ negate
 
     @validate_call
     def check(self, item: Any) -> bool:
@@ -149,17 +218,7 @@ class Pattern(Model):
             >>> Pattern(sub_strings=["A", "b"], match_all=True, case_sensitive=False, negate=True).check("abcde")
             False
         """
-        if self.sub_strings is None:
-            return True ^ self.negate
-
-        item = str(item)
-        _sub_strings = self.sub_strings_list[:]
-
-        if not self.case_sensitive:
-            item = item.lower()
-            _sub_strings = [s.lower() for s in _sub_strings]
-
-        return self.match_function(s in item for s in _sub_strings) ^ self.negate
+        return self.matcher(str(item))
 
     @validate_call
     def __ror__(self, other: str) -> bool:
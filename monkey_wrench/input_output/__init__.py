@@ -19,6 +19,7 @@ from ._models import (
     ParentInputDirectory,
     ParentOutputDirectory,
     Reader,
+    TempDirectory,
     Writer,
 )
 from ._types import (
@@ -55,6 +56,7 @@ __all__ = [
     "OpenMode",
     "ParentInputDirectory",
     "ParentOutputDirectory",
+    "TempDirectory",
     "Writer",
     "copy_files_between_directories",
     "copy_single_file_to_directory",
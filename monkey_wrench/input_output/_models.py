@@ -1,13 +1,23 @@
+import math
 import os
+import re
 import shutil
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import suppress
 from datetime import datetime
+from fractions import Fraction
+from functools import cached_property, lru_cache
+from itertools import batched, chain, compress
 from pathlib import Path
-from typing import Any, Generator, Literal, TypeVar
+from typing import Any, BinaryIO, Callable, Generator, Literal, Mapping, Self, TypeVar
 
+import numpy as np
 from loguru import logger
-from pydantic import AfterValidator, NonNegativeFloat, NonNegativeInt, validate_call
+from pydantic import AfterValidator, ConfigDict, Field, NonNegativeFloat, NonNegativeInt, PositiveInt
 from typing_extensions import Annotated
 
+from monkey_wrench.date_time import DateTimeParserBase
 from monkey_wrench.generic import ListSetTuple, Model, Pattern, StringTransformation, TransformFunction
 from monkey_wrench.input_output._types import (
     ExistingDirectoryPath,
@@ -24,6 +34,163 @@ ReturnType = TypeVar("ReturnType")
 OtherReturnType = TypeVar("OtherReturnType")
 
 
+MAX_FILE_SIZE_TO_READ_AT_ONCE = 1 << 30
+"""The maximum size of a text file in bytes, up to which the whole file is read at once (and not line by line)."""
+
+READ_BUFFER_SIZE = 1 << 20
+"""The size of the read buffer in bytes, used when a text file is read line by line."""
+
+NUMBER_OF_LINES_PER_WRITE = 4096
+"""The number of items which are transformed together, and then written to a text file in a single call."""
+
+FILE_SIZE_BATCH_SIZE = 1024
+"""The maximum number of files whose sizes are retrieved by a single task, when the sizes are retrieved in parallel."""
+
+DATE_ONLY_FORMAT_DIRECTIVES = frozenset("aAbBdjmuUwWyYGVC%")
+"""Directives of a datetime format string whose output only depends on the date (and not the time or timezone)."""
+
+HOUR_AND_MINUTE_FORMAT_DIRECTIVES = frozenset("HIMp")
+"""Directives of a datetime format string whose output only depends on the hour and the minute."""
+
+
+@lru_cache(maxsize=128)
+def _number_of_fields_in_format_string(datetime_format_string: str) -> int:
+    """Return the number of leading fields of (year, month, day, hour, minute) that the format string depends on.
+
+    A value of ``0`` means that the format string depends on other fields as well, e.g. seconds or the timezone.
+    """
+    directives = set(re.findall(r"%(.)", datetime_format_string))
+    if directives <= DATE_ONLY_FORMAT_DIRECTIVES:
+        return 3
+    if directives <= DATE_ONLY_FORMAT_DIRECTIVES | HOUR_AND_MINUTE_FORMAT_DIRECTIVES:
+        return 5
+    return 0
+
+
+@lru_cache(maxsize=4096)
+def _strftime(datetime_format_string: str, *fields: int) -> str:
+    """Format the datetime made from the given fields according to the format string.
+
+    The results are memoized, as the same days (and hours and minutes) repeat a lot.
+    """
+    return datetime(*fields).strftime(datetime_format_string)
+
+
+def _path_sort_key(filepath: str) -> str:
+    """Return the key to sort string filepaths in the same order as their corresponding ``Path`` objects.
+
+    ``Path`` objects are compared component by component. Replacing the separators with the null character, which is
+    smaller than any character allowed in a path, results in the same order while creating a single string per path
+    instead of a list of components.
+    """
+    return filepath.replace(os.sep, "\0")
+
+
+def _corruption_threshold(relative_tolerance: float, nominal_file_size: NonNegativeInt) -> NonNegativeInt:
+    """Return ``floor(relative_tolerance * nominal_file_size)``, where the product is computed exactly.
+
+    The tolerance is converted to a fraction from its (shortest) decimal representation, e.g. ``0.29`` becomes
+    ``29/100``. This avoids the rounding error of the floating-point product, e.g. ``0.29 * 100 == 28.999999999999996``.
+    """
+    return math.floor(Fraction(str(relative_tolerance)) * nominal_file_size)
+
+
+def _get_file_sizes(filepaths: ListSetTuple[Path | str]) -> list[NonNegativeInt]:
+    """Return the sizes of the given files (in the same order), using a single ``stat`` call per file."""
+    return [os.stat(filepath).st_size for filepath in filepaths]
+
+
+def _scan_directory(directory: str, matches: Callable[[str], bool]) -> tuple[list[str], list[str]]:
+    """Scan the given directory (non-recursively) and return the paths of the matching files and the subdirectories.
+
+    Symbolic links to directories are neither followed nor returned as files, i.e. they are skipped (similar to the
+    files visited by ``os.walk()``). The type of a directory entry is known from the directory listing, hence
+    ``is_dir()`` and ``is_symlink()`` need an extra system call only for symbolic links. Directories which cannot be
+    scanned are ignored.
+    """
+    files_list, directories = [], []
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return files_list, directories
+    with entries:
+        for entry in entries:
+            if not entry.is_dir():
+                if matches(entry.path):
+                    files_list.append(entry.path)
+            elif not entry.is_symlink():
+                directories.append(entry.path)
+    return files_list, directories
+
+
+def _walk(directory: str, matches: Callable[[str], bool]) -> list[str]:
+    """Recursively visit the given directory and return the paths of the matching files, in arbitrary order.
+
+    This is equivalent to visiting the directory using ``os.walk()``, but avoids building the intermediate lists of
+    directories and files for each directory.
+    """
+    files_list = []
+    directories = [directory]
+    while directories:
+        files, subdirectories = _scan_directory(directories.pop(), matches)
+        files_list.extend(files)
+        directories.extend(subdirectories)
+    return files_list
+
+
+def _walk_in_parallel(directory: str, matches: Callable[[str], bool], number_of_threads: PositiveInt) -> list[str]:
+    """Similar to :func:`_walk`, but scan the directories concurrently using a pool of threads.
+
+    Each directory is scanned in a separate task, which is submitted as soon as the directory has been discovered.
+    Therefore, all threads are kept busy even if the directory tree is unbalanced, e.g. when there is only a single
+    top-level subdirectory. The results are collected in the calling thread, hence no locking is needed.
+    """
+    files_list = []
+    with ThreadPoolExecutor(max_workers=number_of_threads) as executor:
+        pending = {executor.submit(_scan_directory, directory, matches)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirectories = future.result()
+                files_list.extend(files)
+                pending.update(executor.submit(_scan_directory, d, matches) for d in subdirectories)
+    return files_list
+
+
+def _write_lines(file: BinaryIO, lines: list[str]) -> None:
+    """Write the given lines to the file (UTF-8 encoded), each followed by a newline."""
+    if lines:
+        file.write("\n".join(lines).encode())
+        file.write(b"\n")
+
+
+def _split_lines(content: str, keepends: bool) -> list[str]:
+    """Split the content of a text file into lines, only at line feeds, similar to iterating over the file.
+
+    Note:
+        Unlike ``str.splitlines()``, other characters such as form feeds or unicode line separators are not treated as
+        line boundaries. This way, the lines are the same as the ones returned by ``readlines()``.
+    """
+    lines = content.split("\n")
+    last_line = lines.pop()
+    if keepends:
+        lines = [line + "\n" for line in lines]
+    if last_line:
+        lines.append(last_line)
+    return lines
+
+
+def _posix_fadvise(fd: int, advice: str) -> None:
+    """Advise the kernel on the access pattern of the whole file, e.g. ``"POSIX_FADV_SEQUENTIAL"``.
+
+    Note:
+        This is only a hint. It is silently skipped on platforms without ``os.posix_fadvise()`` or if the advice fails.
+    """
+    if hasattr(os, "posix_fadvise"):
+        with suppress(OSError):
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+
+
 class ExistingInputFile(Model):
     """Pydantic model for an input file which must exist.
 
@@ -80,6 +247,26 @@ class ParentOutputDirectory(Model):
     parent_output_directory_path: ExistingDirectoryPath
 
 
+class TempDirectory(Model):
+    """Pydantic model for the directory inside which temporary directories are created. The directory must exist."""
+
+    temp_directory_path: ExistingDirectoryPath | None = None
+    """The parent directory of temporary directories.
+
+    Defaults to ``None``, which means the default directory of the ``tempfile`` module will be used, e.g. as determined
+    by the ``TMPDIR`` environment variable.
+    """
+
+    def make_temporary_directory(self, prefix: str | None = None) -> tempfile.TemporaryDirectory:
+        """Return a temporary directory (context manager) inside ``temp_directory_path``.
+
+        Note:
+            The directory is passed explicitly to ``tempfile``, instead of modifying the global ``tempfile.tempdir``.
+            As a result, temporary directories of different instances can be safely created concurrently.
+        """
+        return tempfile.TemporaryDirectory(prefix=prefix, dir=self.temp_directory_path)
+
+
 class ExistingInputDirectory(Model):
     """Pydantic model for an input directory which must exist.
 
@@ -111,11 +298,16 @@ class FsSpecCache(Model):
     .. _fsspec cache: https://filesystem-spec.readthedocs.io/en/latest/features.html#file-buffering-and-random-access
     """
 
-    fsspec_cache: Literal["filecache"] = "filecache"
-    """How to buffer, at the moment the only supported option and the default is ``"filecache"``."""
+    fsspec_cache: Literal["filecache", "blockcache"] = "filecache"
+    """How to buffer, either ``"filecache"`` (default) or ``"blockcache"``.
 
-    @property
-    def fsspec_cache_str(self):
+    ``"filecache"`` downloads and stores whole files locally, which suits sequential reads of entire files. In contrast,
+    ``"blockcache"`` only fetches the blocks which are actually accessed, and stores them in sparse local files which
+    are memory-mapped. This suits random access to parts of large files.
+    """
+
+    @cached_property
+    def fsspec_cache_str(self) -> str:
         """Return the cache string with a leading ``::``."""
         return f"::{self.fsspec_cache}"
 
@@ -135,7 +327,12 @@ class DatasetSaveOptions(Model):
 
 
 class Writer(OutputFile):
-    """Pydantic model for an ASCII file (text mode) writer."""
+    """Pydantic model for an ASCII (text) file writer.
+
+    Note:
+        The file is written in binary mode and the items are encoded as UTF-8, with a line feed as the line separator
+        regardless of the platform.
+    """
 
     open_mode: OpenMode = "w"
     """The mode using which the text file will be opened. Defaults to ``"w"``."""
@@ -159,27 +356,25 @@ class Writer(OutputFile):
     caught. As a result, in the case of an empty tuple, no exceptions will be caught.
     """
 
+    write_buffer_size: PositiveInt = 1 << 20
+    """The size of the write buffer in bytes. Defaults to ``1 MiB``.
+
+    A large buffer reduces the number of system calls when writing many short items, e.g. product IDs.
+    """
+
+    @cached_property
+    def _caught_exceptions(self) -> tuple[type[Exception], ...]:
+        """Return the exceptions to catch on write as a tuple, where ``None`` is resolved into all exceptions."""
+        if self.on_write_catch_exceptions is None:
+            return (Exception,)
+        return tuple(self.on_write_catch_exceptions)
+
     def __get_open_mode(self, open_mode: OpenMode | None = None):
         """Return the ``open_mode`` if it is not ``None``. Otherwise return the value of ``self.open_mode``."""
         if open_mode is None:
             return self.open_mode
         return open_mode
 
-    def prepare_output_file_for_writing(self, open_mode: OpenMode | None = None) -> None:
-        """Prepare the output file depending on whether the file exists and the value of ``open_mode``.
-
-        Note:
-            - If the file exists and ``open_mode`` is ``"a"``, the file will be left as it is.
-            - If the file exists and ``open_mode`` is ``"w"``, the file will be overwritten.
-            - If the file does not exist, the file will be created, regardless of ``open_mode``.
-
-        Args:
-            open_mode:
-                Defaults to ``None``, which means the value from ``self.open_mode`` will be used.
-        """
-        with open(self.output_filepath, self.__get_open_mode(open_mode)):
-            pass
-
     def write(
             self,
             items: ListSetTuple | Generator[Any, None, None],
@@ -202,33 +397,98 @@ class Writer(OutputFile):
         Returns:
             The number of items that are written to the file successfully.
         """
-        number_of_items_written = 0
+        with self.__open(open_mode) as f:
+            number_of_items_written = self.__write_items(f, items)
+            self.__release_pages(f)
 
-        with open(self.output_filepath, self.__get_open_mode(open_mode)) as f:
-            for item in items:
-                try:
-                    item = self.pre_writing_transformation.transform_items(str(item))
-                    item = self.pre_writing_transformation.trim_items(item)
-                    f.write(item + "\n")
-                    number_of_items_written += 1
-                except Exception as exception:
-                    if self.on_write_catch_exceptions is None:
-                        continue
-                    if isinstance(exception, self.on_write_catch_exceptions):
-                        logger.warning(f"Failed attempt to write {item} to file {self.path}: {exception}")
-                    raise exception
+        return number_of_items_written
+
+    def __open(self, open_mode: OpenMode | None = None) -> BinaryIO:
+        """Open the output file in the binary mode, using a buffer of size ``write_buffer_size``."""
+        return open(self.output_filepath, f"{self.__get_open_mode(open_mode)}b", buffering=self.write_buffer_size)
+
+    @staticmethod
+    def __release_pages(f: BinaryIO) -> None:
+        """Flush the file and advise the kernel that its pages need not be kept in the page cache.
+
+        The written file is not read back, hence keeping its pages in the page cache is not beneficial.
+        """
+        f.flush()
+        _posix_fadvise(f.fileno(), "POSIX_FADV_DONTNEED")
 
+    def __write_items(self, f: BinaryIO, items: ListSetTuple | Generator[Any, None, None]) -> NonNegativeInt:
+        """Write the items to the already opened file and return the number of items written successfully.
+
+        Each item is transformed exactly once. Items whose transformation fails are skipped or the exception is raised,
+        according to ``on_write_catch_exceptions``. In both cases, the successfully transformed items of the batch are
+        written to the file.
+        """
+        transform_and_trim = self.__transform_and_trim_function()
+        caught_exceptions = self._caught_exceptions
+        number_of_items_written = 0
+        for batch in batched(items, NUMBER_OF_LINES_PER_WRITE):
+            lines = []
+            try:
+                for item in batch:
+                    try:
+                        lines.append(transform_and_trim(item))
+                    except caught_exceptions as exception:
+                        logger.warning(f"Failed attempt to write {item} to file {self.output_filepath}: {exception}")
+            finally:
+                number_of_items_written += self.__write_lines(f, lines)
         return number_of_items_written
 
+    def __transform_and_trim_function(self) -> Callable[[Any], str]:
+        """Return a function which transforms and then trims a single item.
+
+        Whether to transform and whether to trim is decided only once, and not for every item.
+        """
+        function = self.pre_writing_transformation.transform_function
+        trim = self.pre_writing_transformation.trim
+        if function is None:
+            return (lambda item: str(item).strip()) if trim else str
+        if trim:
+            return lambda item: str(function(str(item))).strip()
+        return lambda item: str(function(str(item)))
+
+    def __write_lines(self, f: BinaryIO, lines: list[str]) -> NonNegativeInt:
+        """Write the lines to the file and return their number, or ``0`` if writing fails with a caught exception."""
+        try:
+            _write_lines(f, lines)
+        except self._caught_exceptions as exception:
+            logger.warning(f"Failed attempt to write {len(lines)} items to file {self.output_filepath}: {exception}")
+            return 0
+        return len(lines)
+
     def write_in_batches(self, batches: Batches, open_mode: OpenMode | None = None) -> NonNegativeInt:
         """Similar to `Writer.write()`_, but assumes that the input is in batches.
 
         .. _Writer.write(): monkey_wrench.input_output_models.Writer.write
+
+        Note:
+            The output file is opened only once for all batches. It is however flushed after each batch, so that the
+            items of the batches which have been already retrieved are not lost if retrieving a later batch fails.
+
+        Note:
+            Each batch is written in a background thread, while the next batch is being retrieved, e.g. queried over
+            the network. At most one batch is being written at any time, so that the order of items is preserved.
         """
-        self.prepare_output_file_for_writing(self.__get_open_mode(open_mode))
         number_of_items_written = 0
-        for batch, _ in batches:
-            number_of_items_written += self.write(batch, open_mode="a")
+        with self.__open(open_mode) as f, ThreadPoolExecutor(max_workers=1) as executor:
+            pending_write = None
+            for batch, _ in batches:
+                if pending_write is not None:
+                    number_of_items_written += pending_write.result()
+                pending_write = executor.submit(self.__write_batch, f, batch)
+            if pending_write is not None:
+                number_of_items_written += pending_write.result()
+            self.__release_pages(f)
+        return number_of_items_written
+
+    def __write_batch(self, f: BinaryIO, batch: ListSetTuple | Generator[Any, None, None]) -> NonNegativeInt:
+        """Write a single batch of items to the already opened file and flush the file afterward."""
+        number_of_items_written = self.__write_items(f, batch)
+        f.flush()
         return number_of_items_written
 
 
@@ -256,14 +516,36 @@ class Reader(ExistingInputFile):
 
         Returns:
             A list of (transformed) items, where each item corresponds to a single line in the given file.
+
+        Note:
+            Files larger than ``MAX_FILE_SIZE_TO_READ_AT_ONCE`` are streamed line by line using :func:`read_iter`, so
+            that the whole content of the file and the list of items are not kept in memory at the same time.
         """
+        if os.path.getsize(self.input_filepath) > MAX_FILE_SIZE_TO_READ_AT_ONCE:
+            return list(self.read_iter())
+
         with open(self.input_filepath, "r") as f:
-            items = f.readlines()
+            _posix_fadvise(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+            # The line endings are only kept if they are not going to be trimmed anyway.
+            items = _split_lines(f.read(), keepends=not self.post_reading_transformation.trim)
+            _posix_fadvise(f.fileno(), "POSIX_FADV_DONTNEED")
+
+        return self.post_reading_transformation.trim_and_transform_items(items)
 
-        items = self.post_reading_transformation.trim_items(items)
-        items = self.post_reading_transformation.transform_items(items)
+    def read_iter(self) -> Generator[Any, None, None]:
+        """Lazily read items from a text file, one line at a time.
 
-        return items
+        This is similar to :func:`read`, but the items are yielded one by one instead of being returned as a list.
+
+        Yields:
+            The (transformed) items, where each item corresponds to a single line in the given file.
+        """
+        with open(self.input_filepath, "r", buffering=READ_BUFFER_SIZE) as f:
+            _posix_fadvise(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+            trim_and_transform = self.post_reading_transformation.trim_and_transform_items
+            for line in f:
+                yield trim_and_transform(line)
+            _posix_fadvise(f.fileno(), "POSIX_FADV_DONTNEED")
 
 
 class DirectoryVisitor(ParentInputDirectory, Pattern):
@@ -281,12 +563,26 @@ class DirectoryVisitor(ParentInputDirectory, Pattern):
     Defaults to ``False``, which means sorting is in the alphabetical order.
     """
 
+    sort: bool = True
+    """A boolean to determine whether to sort the files. Defaults to ``True``.
+
+    If it is set to ``False``, the files will be returned in an arbitrary order and ``reverse`` has no effect. This
+    saves the cost of sorting, e.g. when the files are only used to check against a reference.
+    """
+
     recursive: bool = True
     """Determines whether to recursively visit the directory tree. or just visit the top-level directory.
 
     Defaults to ``True``.
     """
 
+    number_of_threads: PositiveInt = 1
+    """The number of threads to recursively visit the directory tree in parallel. Defaults to ``1``.
+
+    A value of ``1`` disables multithreading. Otherwise, each directory is scanned as a separate task as soon as it has
+    been discovered. Threads are suitable here, since listing directories is an I/O workload which releases the GIL.
+    """
+
     post_visit_transform_function: TransformFunction[ReturnType] | None = None
     """The transform function that will be applied on filepaths after visiting them.
 
@@ -297,29 +593,36 @@ class DirectoryVisitor(ParentInputDirectory, Pattern):
     """
 
     def __collect_files(self) -> list[Path]:
+        # Filepaths are kept as plain strings until the very end, so that ``Path`` objects are only constructed for the
+        # files which match the pattern.
         files_list = []
+        matches = self.matcher
 
         if self.recursive:
-            for root, _, files in os.walk(self.parent_input_directory_path):
-                for file in files:
-                    f = Path(root, file)
-                    if self.pattern.check(f):
-                        files_list.append(f)
+            directory = str(self.parent_input_directory_path)
+            if self.number_of_threads > 1:
+                files_list = _walk_in_parallel(directory, matches, self.number_of_threads)
+            else:
+                files_list = _walk(directory, matches)
+            if self.sort:
+                files_list.sort(key=_path_sort_key, reverse=self.reverse)
         else:
-            for item in os.listdir(self.parent_input_directory_path):
-                if (file := Path(self.parent_input_directory_path, item)).is_file():
-                    if self.pattern.check(item):
-                        files_list.append(file)
+            # All files share the same parent directory, hence sorting by their names suffices.
+            with os.scandir(self.parent_input_directory_path) as entries:
+                files_list = [entry.name for entry in entries if entry.is_file() and matches(entry.name)]
+            if self.sort:
+                files_list.sort(reverse=self.reverse)
+            files_list = [os.path.join(self.parent_input_directory_path, f) for f in files_list]
 
-        return sorted(files_list, reverse=self.reverse)
+        return list(map(Path, files_list))
 
     def visit(self) -> list[ReturnType] | list[Path]:
         """Visit all files in the directory, either recursively or just the top-level files.
 
         Returns:
-            A sorted flat list of all file paths in the given directory that match the given pattern and have been
-            treated according to the ``visitor_callback`` function. If the ``post_visit_transform_function`` is provided
-            , a list of transformed filepaths will be returned instead.
+            A (sorted, if ``sort`` is ``True``) flat list of all file paths in the given directory that match the given
+            pattern and have been treated according to the ``visitor_callback`` function. If the
+            ``post_visit_transform_function`` is provided, a list of transformed filepaths will be returned instead.
         """
         files_list = self.__collect_files()
 
@@ -336,16 +639,29 @@ class DirectoryVisitor(ParentInputDirectory, Pattern):
         return files_list
 
 
-@validate_call
 def validate_items(value: ListSetTuple | Reader | DirectoryVisitor) -> ListSetTuple:
-    """Return the items as read from a file, collected from a directory, or simply as they are."""
+    """Return the items as read from a file, collected from a directory, or simply as they are.
+
+    Note:
+        This function is not decorated with ``validate_call`` as it is used as an ``AfterValidator`` and the value has
+        therefore already been validated. Revalidating it would traverse (potentially very large) collections again.
+        Instead, only the type of the value is checked.
+
+    Raises:
+        TypeError:
+            If the value is neither a list/set/tuple, nor a file reader or a directory visitor.
+    """
+    if isinstance(value, (list, set, tuple)):
+        return value
     match value:
         case Reader():
             return value.read()
         case DirectoryVisitor():
             return value.visit()
         case _:
-            return value
+            raise TypeError(
+                f"Expected a list/set/tuple, a `Reader`, or a `DirectoryVisitor`, but got `{type(value).__name__}`."
+            )
 
 
 Items = Annotated[ListSetTuple | Reader | DirectoryVisitor, AfterValidator(validate_items)]
@@ -365,6 +681,8 @@ class FilesIntegrityValidator(MultiProcess):
             1- Checking that the file sizes are within some threshold from a nominal file size.
             2- Checking filepaths against a reference collection.
     """
+    # The raw reference is given and dumped as ``reference``, whereas the attribute ``reference`` returns its items.
+    model_config = ConfigDict(validate_by_name=True, serialize_by_alias=True)
 
     nominal_file_size: NonNegativeInt | None = None
     """The nominal size of files in bytes. This is used to check for corrupted files.
@@ -372,70 +690,168 @@ class FilesIntegrityValidator(MultiProcess):
     Defaults to ``None``, which means the search for corrupted files will not be performed.
     """
 
-    file_size_relative_tolerance: NonNegativeFloat = 0.01
+    file_size_relative_tolerance: Annotated[NonNegativeFloat, Field(allow_inf_nan=False)] = 0.01
     """The maximum relative difference in the size of a file, before it can be marked as corrupted.
 
     Defaults to ``0.01``, i.e. any file whose size differs by more than one percent from the nominal size, will be
-    marked as corrupted.
+    marked as corrupted. The tolerance must be finite.
+    """
+
+    file_size_executor: Literal["thread", "process"] = "thread"
+    """Whether to use threads or processes to retrieve the file sizes in parallel. Defaults to ``"thread"``.
+
+    Retrieving file sizes is a metadata I/O workload which releases the GIL, so threads avoid the cost of spawning
+    processes and pickling the filepaths. The number of workers is determined by ``number_of_threads`` for the former,
+    and by ``number_of_processes`` for the latter.
     """
 
-    filepath_transform_function: TransformFunction[ReturnType] | None = None
+    number_of_threads: PositiveInt = 1
+    """The number of threads to retrieve the file sizes in parallel, if ``file_size_executor`` is ``"thread"``.
+
+    Defaults to ``1``, which disables multithreading.
+    """
+
+    filepath_transform_function: TransformFunction[ReturnType] | type[DateTimeParserBase] | None = None
     """A function to transform the file paths into other types of objects before comparing them against the reference.
 
     This can be e.g. a :func:`~monkey_wrench.date_time.DateTimeParser.parse` function to make datetime objects out of
     file paths. Defaults to ``None`` which means no transformation is performed on the file paths and they will be used
     as they are.
+
+    It can also be a class of type :class:`~monkey_wrench.date_time.DateTimeParser`, in which case all file paths are
+    parsed at once using :func:`~monkey_wrench.date_time.DateTimeParserBase.parse_collection`. This skips the
+    validation of each single file path and is therefore faster for large collections.
     """
 
     filepaths: Items
     """The file paths to perform the validation on."""
 
-    reference: Items | None = None
-    """Reference items to compare against, used in finding the missing files.
+    reference_source: ListSetTuple | Reader | DirectoryVisitor | None = Field(default=None, alias="reference")
+    """Reference items to compare against, used in finding the missing files. It is given as ``reference``.
+
+    Similar to ``filepaths``, it can be a list/set/tuple of items, a file reader, or a directory visitor. However, the
+    items are not read or collected at the time of construction, but only once they are needed for the first time. See
+    :attr:`reference`.
 
     Defaults to ``None`` which means the search for missing files will not be performed.
     """
 
+    @cached_property
+    def reference(self) -> ListSetTuple | None:
+        """Return the reference items, as read from a file, collected from a directory, or simply as they are.
+
+        The reference is resolved only once per instance, on first access, and the result is reused afterward.
+        """
+        return None if self.reference_source is None else validate_items(self.reference_source)
+
+    @cached_property
+    def _corruption_threshold(self) -> NonNegativeInt:
+        """Return the maximum absolute difference (in bytes) between the size of a file and the nominal file size.
+
+        Note:
+            Since file sizes are integers, ``abs(file_size - nominal_file_size) > threshold`` is equivalent to
+            ``abs(file_size - nominal_file_size) > file_size_relative_tolerance * nominal_file_size``, but does not
+            require any floating-point operations per file. The product is computed exactly, using the decimal value of
+            the tolerance, so that e.g. a tolerance of ``0.29`` and a nominal size of ``100`` result in a threshold of
+            ``29`` bytes, whereas ``int(0.29 * 100)`` is ``28``.
+        """
+        return _corruption_threshold(self.file_size_relative_tolerance, self.nominal_file_size)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Return a copy of the model, in which the cached properties are dropped if any field is updated.
+
+        Note:
+            Otherwise, the copy would keep e.g. the :attr:`reference` items of the original instance, even if
+            ``reference_source`` is updated. Unlike :func:`~monkey_wrench.generic.Model.new_with`, the updated values
+            are not validated.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in ("reference", "_corruption_threshold"):
+                copied.__dict__.pop(name, None)
+        return copied
+
     def file_is_corrupted(self, file_size: NonNegativeInt) -> bool:
-        return abs(1 - file_size / self.nominal_file_size) > self.file_size_relative_tolerance
+        """Check whether a single file with the given size is corrupted.
+
+        Note:
+            :func:`find_corrupted_files` performs the same check for all files at once, using NumPy arrays.
+        """
+        return abs(file_size - self.nominal_file_size) > self._corruption_threshold
 
-    @validate_call
     def find_corrupted_files(self, filepaths: Items | None = None) -> set[Path] | None:
-        if filepaths is None:
-            filepaths = self.filepaths
+        filepaths = self.filepaths if filepaths is None else validate_items(filepaths)
 
         if None in [filepaths, self.nominal_file_size]:
             return None
 
-        file_sizes = self.run_with_results(os.path.getsize, filepaths)
-        return {fp for fp, fs in zip(filepaths, file_sizes, strict=True) if self.file_is_corrupted(fs)}
+        if self.file_size_executor == "thread":
+            number_of_workers = self.number_of_threads
+        else:
+            number_of_workers = self.number_of_processes
+
+        if number_of_workers == 1:
+            file_sizes = _get_file_sizes(filepaths)
+        else:
+            batch_size = min(FILE_SIZE_BATCH_SIZE, -(-len(filepaths) // number_of_workers)) or 1
+            batches = list(batched(filepaths, batch_size))
+            if self.file_size_executor == "thread":
+                with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+                    file_sizes = chain.from_iterable(executor.map(_get_file_sizes, batches))
+            else:
+                file_sizes = chain.from_iterable(self.run_with_results(_get_file_sizes, batches))
+        file_sizes = np.fromiter(file_sizes, dtype=np.int64, count=len(filepaths))
+        is_corrupted = np.abs(file_sizes - self.nominal_file_size) > self._corruption_threshold
+        return set(compress(filepaths, is_corrupted))
+
+    def transform_files(self, filepaths: ListSetTuple[Path]) -> set[ReturnType] | set[Path]:
+        """Return the set of filepaths, after being transformed according to ``filepath_transform_function``."""
+        if isinstance(self.filepath_transform_function, type):
+            return set(self.filepath_transform_function.parse_collection(filepaths))
+        if self.filepath_transform_function is not None:
+            return set(map(self.filepath_transform_function, filepaths))
+        if isinstance(filepaths, set):
+            return filepaths
+        return set(filepaths)
 
-    @validate_call
     def find_missing_files(
             self, filepaths: Items | None = None, reference: Items | None = None
     ) -> set[Path] | None:
-        if filepaths is None:
-            filepaths = self.filepaths
-
-        if reference is None:
-            reference = self.reference
+        filepaths = self.filepaths if filepaths is None else validate_items(filepaths)
+        reference = self.reference if reference is None else validate_items(reference)
 
         if None in [reference, filepaths]:
             return None
 
-        if self.filepath_transform_function is not None:
-            filepaths = {self.filepath_transform_function(f) for f in filepaths}
-        else:
-            filepaths = set(filepaths)
-
-        return set(reference) - filepaths
+        filepaths = self.transform_files(filepaths)
+        return {item for item in reference if item not in filepaths}
 
-    @validate_call
     def verify_files(
             self, filepaths: Items | None = None, reference: Items | None = None
     ) -> tuple[set[InputType] | set[ReturnType] | None, set[Path] | None]:
-        """Check for missing and corrupted files."""
-        return self.find_missing_files(filepaths, reference), self.find_corrupted_files(filepaths)
+        """Check for missing and corrupted files.
+
+        Note:
+            The methods which verify files are not decorated with ``validate_call``, since they are mostly called with
+            already validated items, e.g. ``self.filepaths`` and ``self.reference``. Readers and directory
+            visitors are still resolved into their items, but only once for both checks. Any other type of items is
+            rejected by :func:`validate_items`.
+
+        Note:
+            If both checks are to be performed, the file sizes are retrieved in a background thread, while the
+            filepaths are transformed and compared against the reference. Retrieving file sizes is I/O-bound and
+            releases the GIL, hence the two checks overlap.
+        """
+        filepaths = self.filepaths if filepaths is None else validate_items(filepaths)
+        reference = self.reference if reference is None else validate_items(reference)
+
+        if None in [filepaths, reference, self.nominal_file_size]:
+            return self.find_missing_files(filepaths, reference), self.find_corrupted_files(filepaths)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            corrupted_files = executor.submit(self.find_corrupted_files, filepaths)
+            missing_files = self.find_missing_files(filepaths, reference)
+            return missing_files, corrupted_files.result()
 
 
 class DateTimeDirectory(ParentOutputDirectory):
@@ -471,8 +887,11 @@ class DateTimeDirectory(ParentOutputDirectory):
             >>> expected_path == path
             True
         """
-        dir_path = self.parent_output_directory_path / Path(datetime_object.strftime(self.datetime_format_string))
-        return dir_path
+        if n := _number_of_fields_in_format_string(self.datetime_format_string):
+            dir_name = _strftime(self.datetime_format_string, *datetime_object.timetuple()[:n])
+        else:
+            dir_name = datetime_object.strftime(self.datetime_format_string)
+        return self.parent_output_directory_path / dir_name
 
     def create_datetime_directory(self, datetime_object: datetime) -> Path:
         """Create a directory based on the datetime object.
@@ -498,7 +917,7 @@ class DateTimeDirectory(ParentOutputDirectory):
             True
         """
         dir_path = self.get_datetime_directory(datetime_object)
-        if dir_path.exists() and self.reset_child_datetime_directory:
+        if self.reset_child_datetime_directory and dir_path.is_dir():
             shutil.rmtree(dir_path)
         dir_path.mkdir(parents=True, exist_ok=True)
         return dir_path
@@ -1,6 +1,6 @@
+from collections import defaultdict
 from datetime import datetime
-
-from pydantic import validate_call
+from functools import cached_property
 
 from monkey_wrench.date_time import HritFilePathParser
 from monkey_wrench.generic import Model
@@ -14,19 +14,25 @@ class HritFilesCollector(Model):
     hrit_files: list[ExistingFilePath] | DirectoryVisitor
     """A list of filepaths or a directory visitor for the directory containing SEVIRI observation in HRIT format."""
 
-    @property
-    @validate_call
+    @cached_property
     def sorted_files(self) -> dict[datetime, list[ExistingFilePath]]:
         """Get the HRIT files sorted by time.
 
-        It will be returned as a dictionary mapping datetime objects to the corresponding observation files.
+        It will be returned as a dictionary mapping datetime objects to the corresponding observation files. The keys
+        are in chronological order and the files of each key are sorted by their paths.
+
+        The files are collected, parsed, and sorted only once per instance, i.e. on first access.
+
+        Note:
+            All filepaths are parsed at once and the files are sorted by their parsed datetime objects first. Therefore,
+            the (long) paths of HRIT files are only compared with each other if they belong to the same observation.
         """
         filepaths = self.hrit_files
         if isinstance(filepaths, DirectoryVisitor):
             filepaths = filepaths.visit()
-        filepaths = sorted(list(filepaths))
+        datetime_objects = HritFilePathParser.parse_collection(filepaths)
 
-        sorted_filepaths = {}
-        for filepath in filepaths:
-            sorted_filepaths.setdefault(HritFilePathParser.parse(filepath), []).append(filepath)
-        return sorted_filepaths
+        sorted_filepaths = defaultdict(list)
+        for datetime_object, filepath in sorted(zip(datetime_objects, filepaths, strict=True)):
+            sorted_filepaths[datetime_object].append(filepath)
+        return dict(sorted_filepaths)
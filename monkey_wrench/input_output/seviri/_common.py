@@ -1,14 +1,18 @@
 """The module providing utilities for SEVIRI-CHIMP related filename operations."""
 
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
 from pydantic import validate_call
 
 from monkey_wrench.date_time import SeviriIDParser
-from monkey_wrench.generic import ListSetTuple, apply_to_single_or_collection, type_
+from monkey_wrench.generic import ListSetTuple, apply_to_single_or_collection
 from monkey_wrench.input_output.seviri._types import ChimpFilesPrefix
 
+_FILENAME_FORMAT = "%s_%04d%02d%02d_%02d_%02d%s"
+"""The printf-style format of CHIMP-compliant filenames, i.e. ``"<prefix>_<YYYYmmDD>_<HH>_<MM><extension>"``."""
+
 
 @validate_call
 def input_filename_from_product_id(
@@ -39,7 +43,7 @@ def input_filename_from_product_id(
         ... ))
         (PosixPath('seviri_20150731_22_12.nc'), PosixPath('seviri_20231231_17_12.nc'))
     """
-    return __dispatch(ChimpFilesPrefix.seviri, product_ids, extension)
+    return __from_product_ids(ChimpFilesPrefix.seviri, product_ids, extension)
 
 
 @validate_call
@@ -68,7 +72,7 @@ def input_filename_from_datetime(
         ... )
         [PosixPath('seviri_20200101_00_12.nc'), PosixPath('seviri_20200304_02_42.nc')]
     """
-    return __dispatch(ChimpFilesPrefix.seviri, datetime_objects, extension)
+    return __from_datetimes(ChimpFilesPrefix.seviri, datetime_objects, extension)
 
 
 @validate_call
@@ -100,7 +104,7 @@ def output_filename_from_product_id(
         ... ])
         [PosixPath('chimp_20150731_22_12.nc'), PosixPath('chimp_20231231_17_12.nc')]
     """
-    return __dispatch(ChimpFilesPrefix.chimp, product_ids, extension)
+    return __from_product_ids(ChimpFilesPrefix.chimp, product_ids, extension)
 
 
 @validate_call
@@ -129,7 +133,7 @@ def output_filename_from_datetime(
         ... )
         [PosixPath('chimp_20200101_00_12.nc'), PosixPath('chimp_20200304_02_42.nc')]
     """
-    return __dispatch(ChimpFilesPrefix.chimp, datetime_objects)
+    return __from_datetimes(ChimpFilesPrefix.chimp, datetime_objects, extension)
 
 
 @validate_call
@@ -147,23 +151,43 @@ def datetime_to_filename(prefix: ChimpFilesPrefix, datetime_object: datetime, ex
     Returns:
         A filename with the following format ``"<prefix>_<year><month><day>_<hour>_<minute><extension>"``.
     """
-    chimp_timestamp_str = datetime_object.strftime("%Y%m%d_%H_%M")
-    return Path(f"{prefix.value}_{chimp_timestamp_str}{extension}")
+    return _datetime_to_filename(prefix.value, extension, datetime_object)
 
 
-@validate_call
-def __dispatch(
-        prefix: ChimpFilesPrefix,
-        single_item_or_list: datetime | str | ListSetTuple[datetime] | ListSetTuple[str],
-        extension: str = ".nc"
-) -> Path | list[Path]:
-    """Dispatch the given input to its corresponding CHIMP-compliant filename function."""
-    tp = type_(single_item_or_list)
-    if tp is datetime:
-        return apply_to_single_or_collection(lambda x: datetime_to_filename(prefix, x), single_item_or_list)
-    elif tp is str:
-        return apply_to_single_or_collection(
-            lambda x: datetime_to_filename(prefix, SeviriIDParser.parse(x), extension), single_item_or_list
-        )
-    else:
-        raise TypeError(f"I do not know how to dispatch for type {tp}.")
+def _datetime_to_filename(prefix: str, extension: str, datetime_object: datetime) -> Path:
+    """Similar to :func:`datetime_to_filename`, but without validation and with the prefix as a plain string.
+
+    The datetime object is the last argument, so that the function can be bound to the prefix and the extension using
+    ``functools.partial()``.
+
+    Note:
+        The timestamp is equivalent to ``datetime_object.strftime("%Y%m%d_%H_%M")``, but it is formatted directly from
+        the integer attributes. The printf-style formatting is used, since it formats all fields in a single call,
+        whereas an f-string calls ``format()`` once per field.
+    """
+    d = datetime_object
+    return Path(_FILENAME_FORMAT % (prefix, d.year, d.month, d.day, d.hour, d.minute, extension))
+
+
+def __from_datetimes(
+        prefix: ChimpFilesPrefix, datetime_objects: datetime | ListSetTuple[datetime], extension: str
+) -> Path | ListSetTuple[Path]:
+    """Generate CHIMP-compliant filename(s) with the given prefix, based on (a) datetime object(s).
+
+    Note:
+        This function is not decorated with ``validate_call``, as it is only called by the public functions of this
+        module, which have already validated the input.
+    """
+    return apply_to_single_or_collection(partial(_datetime_to_filename, prefix.value, extension), datetime_objects)
+
+
+def __from_product_ids(
+        prefix: ChimpFilesPrefix, product_ids: str | ListSetTuple[str], extension: str
+) -> Path | ListSetTuple[Path]:
+    """Generate CHIMP-compliant filename(s) with the given prefix, based on (a) SEVIRI product ID(s).
+
+    Note:
+        Similar to :func:`__from_datetimes`, this function does not validate its input. Product IDs are parsed into
+        datetime objects at once using :func:`~monkey_wrench.date_time.SeviriIDParser.parse_collection`.
+    """
+    return __from_datetimes(prefix, SeviriIDParser.parse_collection(product_ids), extension)
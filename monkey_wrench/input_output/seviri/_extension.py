@@ -4,6 +4,7 @@ The extension allows for reading SEVIRI resampled files.
 """
 
 from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
 from typing import Callable, Generator
 
@@ -34,8 +35,14 @@ Warning:
 
 # The following function embeds a class which makes it too complex.
 # Therefore, we supress Ruff linter rule C901.
-def _seviri_extension_factory():  # noqa: C901
-    """Instantiate a class of type ``SEVIRI``, so that it will be available in the CHIMP namespace."""
+@cache
+def _seviri_dataset_class() -> type:  # noqa: C901
+    """Define and return the ``SEVIRI`` class.
+
+    Note:
+        The class is defined only once, i.e. on the first call, as the imports and the class definition do not depend
+        on any arguments. The imports are deferred until then, since ``torch`` and ``chimp`` are heavy dependencies.
+    """
     import torch
     import xarray as xr
     from chimp.data import InputDataset
@@ -54,6 +61,27 @@ def _seviri_extension_factory():  # noqa: C901
             """Retrieve the number of channels in the dataset."""
             return len(self.variables)
 
+        def _read_channels(self, input_file: Path, slices: tuple[slice, slice]) -> np.ndarray | None:
+            """Read all channels from the input file into a single array, or return ``None`` if reading fails.
+
+            The channels are copied into a single preallocated array, which is already of the final data type, i.e.
+            ``float32``. Casting early does not change the values, since rotations use the nearest neighbour.
+            """
+            x_s = None
+            try:
+                with xr.open_dataset(input_file) as data:
+                    # The spatial slices are applied once to all channels, instead of indexing each channel separately.
+                    subset = data[list(self.variables)].isel(dict(zip(self.spatial_dims, slices, strict=True)))
+                    for i, v in enumerate(self.variables):
+                        channel = subset[v].data
+                        if x_s is None:
+                            x_s = np.empty((self.n_channels,) + channel.shape, dtype=np.float32)
+                        x_s[i] = channel
+            except OSError as e:
+                logger.warning(f"Reading of the input file {input_file} failed. Skipping.\nMore:{e}")
+                return None
+            return x_s
+
         def load_sample(
                 self,
                 input_file: Path,
@@ -91,43 +119,47 @@ def _seviri_extension_factory():  # noqa: C901
                 crop_size = (crop_size,) * self.n_dim
             crop_size = tuple((int(size / relative_scale) for size in crop_size))
 
-            x_s = np.full(((self.n_channels,) + crop_size), np.nan)
-            if input_file is not None:
-                slices = scale_slices(slices, relative_scale)
-                try:
-                    with xr.open_dataset(input_file) as data:
-                        vs = [data[v][dict(zip(self.spatial_dims, slices, strict=True))].data for v in self.variables]
-                        x_s = np.stack(vs, axis=0)
-                except OSError as e:
-                    logger.warning(f"Reading of the input file {input_file} failed. Skipping.\nMore:{e}")
-
-                # Apply augmentations
-                if rotate is not None:
-                    x_s = ndimage.rotate(
-                        x_s, rotate, order=0, reshape=False, axes=(-2, -1), cval=np.nan
-                    )
-                    height = x_s.shape[-2]
-
-                    # In case of a rotation, we may need to cut off some input.
-                    height_out = crop_size[0]
-                    if height > height_out:
-                        start = (height - height_out) // 2
-                        end = start + height_out
-                        x_s = x_s[..., start:end, :]
-
-                    width = x_s.shape[-1]
-                    width_out = crop_size[1]
-                    if width > width_out:
-                        start = (width - width_out) // 2
-                        end = start + width_out
-                        x_s = x_s[..., start:end]
-
-                if flip:
-                    x_s = np.flip(x_s, -2)
-
-            return torch.tensor(x_s.copy(), dtype=torch.float32)
-
-    return SEVIRI("seviri")
+            if input_file is None:
+                return torch.full((self.n_channels,) + crop_size, np.nan, dtype=torch.float32)
+
+            x_s = self._read_channels(input_file, scale_slices(slices, relative_scale))
+            if x_s is None:
+                x_s = np.full((self.n_channels,) + crop_size, np.nan, dtype=np.float32)
+
+            # Apply augmentations
+            if rotate is not None:
+                x_s = ndimage.rotate(
+                    x_s, rotate, order=0, reshape=False, axes=(-2, -1), cval=np.nan
+                )
+                height = x_s.shape[-2]
+
+                # In case of a rotation, we may need to cut off some input.
+                height_out = crop_size[0]
+                if height > height_out:
+                    start = (height - height_out) // 2
+                    end = start + height_out
+                    x_s = x_s[..., start:end, :]
+
+                width = x_s.shape[-1]
+                width_out = crop_size[1]
+                if width > width_out:
+                    start = (width - width_out) // 2
+                    end = start + width_out
+                    x_s = x_s[..., start:end]
+
+            if flip:
+                x_s = np.flip(x_s, -2)
+
+            # The array is only copied if it is not contiguous, e.g. after flipping. Otherwise, the tensor shares the
+            # memory of the array, which is not used anywhere else.
+            return torch.from_numpy(np.ascontiguousarray(x_s))
+
+    return SEVIRI
+
+
+def _seviri_extension_factory():
+    """Instantiate a class of type ``SEVIRI``, so that it will be available in the CHIMP namespace."""
+    return _seviri_dataset_class()("seviri")
 
 
 @contextmanager
@@ -1,9 +1,8 @@
 """The module providing a function to read and resample SEVIRI native files from ``FSFile`` objects."""
 
 import os
-import tempfile
 import warnings
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
 from pathlib import Path
 from typing import Callable
 from uuid import uuid4
@@ -18,7 +17,7 @@ from satpy.readers.core.utils import FSFile
 from monkey_wrench.date_time import SeviriIDParser
 from monkey_wrench.generic import Function
 from monkey_wrench.geometry import Area
-from monkey_wrench.input_output._models import DatasetSaveOptions, DateTimeDirectory, FsSpecCache
+from monkey_wrench.input_output._models import DatasetSaveOptions, DateTimeDirectory, FsSpecCache, TempDirectory
 from monkey_wrench.input_output.seviri._common import input_filename_from_product_id
 from monkey_wrench.query import EumetsatAPI
 
@@ -63,16 +62,17 @@ class RemoteSeviriFile(FsSpecCache):
         }
         fstr = f"zip://*.nat{self.fsspec_cache_str}::{EumetsatAPI.seviri_collection_url()}/{product_id}"
         logger.info(f"Opening {fstr}")
-        return [
-            FSFile(f) for f in open_files(
+        # Only the first matching file is used, therefore only that one is wrapped into an ``FSFile``.
+        return FSFile(
+            open_files(
                 fstr,
                 https=https_header,
-                filecache={"cache_storage": str(temporary_directory)}
-            )
-        ][0]
+                **{self.fsspec_cache: {"cache_storage": str(temporary_directory)}}
+            )[0]
+        )
 
 
-class Resampler(Area, DatasetSaveOptions, DateTimeDirectory, RemoteSeviriFile):
+class Resampler(Area, DatasetSaveOptions, DateTimeDirectory, RemoteSeviriFile, TempDirectory):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     output_filename_generator: Function[Path] | Callable[[str], Path] = input_filename_from_product_id
@@ -106,13 +106,14 @@ class Resampler(Area, DatasetSaveOptions, DateTimeDirectory, RemoteSeviriFile):
         # It is useful in the case of multiprocessing.
         log_id = uuid4()
 
-        with tempfile.TemporaryDirectory(prefix=f"resample_fsspec_{log_id}_") as temporary_directory:
+        with self.make_temporary_directory(prefix=f"resample_fsspec_{log_id}_") as temporary_directory:
             fs_file = self.open(product_id, temporary_directory)
             output_directory = self.create_datetime_directory(SeviriIDParser.parse(product_id))
             output_filename = output_directory / self.output_filename_generator(str(fs_file))
 
-            if self.remove_file_if_exists and os.path.exists(output_filename):
-                os.remove(output_filename)
+            if self.remove_file_if_exists:
+                with suppress(FileNotFoundError):
+                    os.remove(output_filename)
 
             logger.info(f"Resampling SEVIRI native file `{fs_file}` to `{output_filename}` -- ID: `{log_id}`")
             scene = Scene([fs_file], "seviri_l1b_native")
@@ -1,9 +1,14 @@
 """The module providing functionalities for multiprocessing."""
 
+from contextlib import contextmanager
 from multiprocessing import get_context
-from typing import Callable, TypeVar
+from multiprocessing.connection import wait
+from multiprocessing.pool import Pool
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, Generator, Self, TypeVar
 
-from pydantic import NonNegativeInt
+from loguru import logger
+from pydantic import PositiveInt, PrivateAttr
 
 from monkey_wrench.generic import ListSetTuple, Model
 
@@ -22,14 +27,67 @@ class MultiProcess(Model):
                 print(x[0] ** x[1])  # We use indices to extract our desired arguments from the single input argument.
 
             MultiProcess(number_of_processes=2).run(power, [(1, 3), (2, 5)])
+
+        To avoid starting new worker processes for every call, several calls of :func:`run_with_results` can share the
+        same pool of workers:
+
+        .. code-block:: python
+
+            with MultiProcess(number_of_processes=2) as multi_process:
+                multi_process.run_with_results(power, [(1, 3), (2, 5)])
+                multi_process.run_with_results(power, [(3, 3), (4, 5)])
     """
 
-    number_of_processes: NonNegativeInt = 1
+    number_of_processes: PositiveInt = 1
     """Number of process to use. Defaults to ``1``.
 
     A value of ``1`` disables multiprocessing. This is useful for e.g. testing purposes.
     """
 
+    _pool: Pool | None = PrivateAttr(default=None)
+    _reuse_pool: bool = PrivateAttr(default=False)
+
+    def __enter__(self) -> Self:
+        """Keep the pool of worker processes alive across calls, until the context is exited."""
+        self._reuse_pool = True
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """Close the pool of worker processes, see :func:`close`."""
+        self.close()
+
+    def __getstate__(self) -> dict[Any, Any]:
+        """Exclude the pool of worker processes when pickling, e.g. when a bound method is sent to the workers."""
+        state = super().__getstate__()
+        private = state.get("__pydantic_private__")
+        if private is not None and private.get("_pool") is not None:
+            state["__pydantic_private__"] = private | dict(_pool=None, _reuse_pool=False)
+        return state
+
+    def close(self) -> None:
+        """Close the pool of worker processes, if any, and wait for the workers to exit."""
+        self._reuse_pool = False
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    @contextmanager
+    def _worker_pool(self) -> Generator[Pool, None, None]:
+        """Yield a pool of worker processes.
+
+        Inside a ``with`` block, the pool is created on the first call and then reused until the block is exited.
+        Otherwise, a new pool is created and terminated for each call.
+        """
+        if not self._reuse_pool:
+            with get_context("spawn").Pool(processes=self.number_of_processes) as pool:
+                yield pool
+            return
+
+        if self._pool is None:
+            self._pool = get_context("spawn").Pool(processes=self.number_of_processes)
+        yield self._pool
+
     def run_with_results(self, function: Callable[[T], R], arguments: ListSetTuple[T]) -> list[R]:
         """Call the provided function with different arguments using multiple processes.
 
@@ -45,31 +103,56 @@ class MultiProcess(Model):
 
         Returns:
             A list of returned results from the function in the same order as the given arguments (if not a set).
-        """
-        ctx = get_context("spawn")
 
+        Note:
+            As the order of a set is arbitrary anyway, the results for a set are collected as soon as they are
+            available. In this case, the arguments are sent to the worker processes in chunks, so that each worker
+            receives about four chunks, similar to what ``Pool.map()`` does by default for the other collections.
+        """
         if self.number_of_processes == 1:
             return [function(arg) for arg in arguments]
 
-        with ctx.Pool(processes=self.number_of_processes) as pool:
-            results = pool.map(function, arguments)
-
-        return results
+        with self._worker_pool() as pool:
+            if isinstance(arguments, set):
+                chunksize = max(1, len(arguments) // (4 * self.number_of_processes))
+                return list(pool.imap_unordered(function, arguments, chunksize=chunksize))
+            return pool.map(function, arguments)
 
     def run(self, function: Callable[[T], R], arguments: ListSetTuple[T]) -> None:
         """Similar to :func:`run_with_results`, but does not return anything.
 
-        If the function returns anything, it will be discarded!
+        If the function returns anything, it will be discarded! The function is called with each argument in a separate
+        process, so that memory does not build up across calls, e.g. when resampling many files. At most
+        ``number_of_processes`` processes are alive at the same time, and a new one is started as soon as any of them
+        exits. The pool of workers shared inside a ``with`` block is therefore not used here.
+
+        Note:
+            If the function raises an exception, or its process is killed, e.g. by a signal or the OOM killer, for one
+            argument, the failure is logged and the function is still called with the rest of the arguments.
         """
         ctx = get_context("spawn")
-        arguments = list(arguments)
-        for index in range(0, len(arguments), self.number_of_processes):
-            procs = []
-            for arg in arguments[index: index + self.number_of_processes]:
-                proc = ctx.Process(target=function, args=(arg,))
-                procs.append(proc)
-                proc.start()
-            for proc in procs:
-                proc.join()
-            for proc in procs:
-                proc.close()
+        running: dict[int, tuple[BaseProcess, T]] = {}
+        for arg in arguments:
+            if len(running) == self.number_of_processes:
+                _join_exited_processes(running)
+            proc = ctx.Process(target=function, args=(arg,))
+            proc.start()
+            running[proc.sentinel] = (proc, arg)
+        while running:
+            _join_exited_processes(running)
+
+
+def _join_exited_processes(running: dict[int, tuple[BaseProcess, Any]]) -> None:
+    """Wait for at least one of the running processes to exit, then join and remove all the processes that have exited.
+
+    Args:
+        running:
+            A dictionary which maps the sentinels of the running processes to the processes and their arguments. It is
+            modified in-place.
+    """
+    for sentinel in wait(list(running)):
+        proc, arg = running.pop(sentinel)
+        proc.join()
+        if proc.exitcode != 0:
+            logger.error(f"Calling the function with `{arg}` failed, its process exited with code {proc.exitcode}.")
+        proc.close()
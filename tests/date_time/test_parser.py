@@ -94,6 +94,14 @@ def test_SeviriIDParser_parse_collection():
         datetime(2024, 11, 20, 17, 27, tzinfo=UTC),
     ]
     assert datetime_objects == SeviriIDParser.parse_collection(seviri_ids)
+    assert tuple(datetime_objects) == SeviriIDParser.parse_collection(tuple(seviri_ids))
+
+
+def test_SeviriIDParser_parse_collection_cached():
+    seviri_id = "MSG3-SEVI-MSG15-0100-NA-20150731221240.036000000Z-NA"
+    hits = SeviriIDParser._parse_item.cache_info().hits
+    assert SeviriIDParser.parse_collection([seviri_id, seviri_id]) == [SeviriIDParser.parse(seviri_id)] * 2
+    assert SeviriIDParser._parse_item.cache_info().hits > hits
 
 
 @pytest.mark.parametrize("seviri_id", [
@@ -123,6 +131,7 @@ def test_FilePathParser_parse(filename):
     for func in [Path, lambda x: x]:
         datetime_obj = ChimpFilePathParser.parse(func(filename))
         assert datetime(2015, 7, 31, 22, 12, tzinfo=UTC) == datetime_obj
+        assert [datetime_obj] == ChimpFilePathParser.parse_collection([func(filename)])
 
 
 @pytest.mark.parametrize("filename", [
@@ -140,6 +149,8 @@ def test_FilePathParser_parse_raise(filename):
     for func in [Path, lambda x: x]:
         with pytest.raises(ValueError, match="into a valid datetime object"):
             ChimpFilePathParser.parse(func(filename))
+        with pytest.raises(ValueError, match="into a valid datetime object"):
+            ChimpFilePathParser.parse_collection([func(filename)])
 
 
 # ======================================================
@@ -158,6 +169,15 @@ def test_HritFilePathParser_parse(path, filename):
     for func in [Path, lambda x: x]:
         datetime_obj = HritFilePathParser.parse(func(path + filename))
         assert datetime(2015, 7, 31, 22, 12, tzinfo=UTC) == datetime_obj
+        assert [datetime_obj] == HritFilePathParser.parse_collection([func(path + filename)])
+        hits = HritFilePathParser._parse_item.cache_info().hits
+        assert [datetime_obj] == HritFilePathParser.parse_collection([func(path + filename)])
+        assert HritFilePathParser._parse_item.cache_info().hits == hits + 1
+
+        with pytest.raises(ValueError, match="into a valid datetime object"):
+            HritFilePathParser.parse(func(path + filename[:-3]))
+        with pytest.raises(ValueError, match="into a valid datetime object"):
+            HritFilePathParser.parse_collection([func(path + filename[:-3])])
 
     with pytest.raises(ValueError, match="into a valid datetime object"):
         ChimpFilePathParser.parse(func(path + filename + "-"))
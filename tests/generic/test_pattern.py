@@ -37,18 +37,21 @@ from monkey_wrench.generic import Pattern, StringTransformation
     (dict(sub_strings=["This", "is", "a", "sample"], match_all=True, case_sensitive=True), True),
     (dict(sub_strings=["This", "is", "a", "not", "sample"], match_all=True, case_sensitive=True), False),
     (dict(sub_strings=["This", "is", "a", "not", "sample"], match_all=False, case_sensitive=True), True),
+    #
+    (dict(sub_strings=[], match_all=False), False),
+    (dict(sub_strings=["a.s", "S*"], match_all=False, case_sensitive=False), False),
+    (dict(sub_strings=["a s", "!"], match_all=True, case_sensitive=True), True),
 ])
 def test_pattern_exist(negate, kwargs, res):
     pattern = Pattern(**kwargs, negate=negate)
-    match_function = all if kwargs.get("match_all", True) else any
     sub_strings = kwargs.get("sub_strings", pattern.sub_strings)
 
     assert pattern.check("This is a sample!") is (res ^ negate)
     assert ("This is a sample!" | pattern) is (res ^ negate)
+    assert pattern.matcher("This is a sample!") is (res ^ negate)
     assert pattern.sub_strings_list == sub_strings if isinstance(sub_strings, list) else [sub_strings]
     assert pattern.case_sensitive is kwargs.get("case_sensitive", True)
     assert pattern.match_all is kwargs.get("match_all", True)
-    assert pattern.match_function is match_function
 
 
 @pytest.mark.parametrize(("sub_strings", "expected"), [
@@ -80,6 +83,20 @@ def test_Trim(inp):
     assert StringTransformation(transform_function=lambda x: str(x).strip()).transform_items(inp) == expected(inp)
 
 
+@pytest.mark.parametrize("trim", [True, False])
+@pytest.mark.parametrize("transform_function", [None, str.upper, lambda x: f" {x}!"])
+@pytest.mark.parametrize("inp", [
+    f" {test_string} \n",
+    [f" {test_string}", f"{test_string} "],
+    (f" {test_string} \n\t", f"\t\t {test_string} \n\t"),
+])
+def test_Trim_fused(trim, transform_function, inp):
+    transformation = StringTransformation(trim=trim, transform_function=transform_function)
+    trimmed_and_transformed = transformation.transform_items(transformation.trim_items(inp))
+
+    assert transformation.trim_and_transform_items(inp) == trimmed_and_transformed
+
+
 def expected(inp):
     match inp:
         case str():
@@ -28,3 +28,16 @@ def test_HritFilesCollector(files):
     assert Counter(sorted_files.keys()) == Counter(get_datetime_keys())
     assert Counter([v for vs in sorted_files.values() for v in vs]) == Counter(files)
     assert sorted_files_dir == sorted_files
+    assert list(sorted_files.keys()) == sorted(sorted_files.keys())
+    assert all(vs == sorted(vs) for vs in sorted_files.values())
+
+
+def test_HritFilesCollector_cached(files):
+    files, tmpdir = files
+    visited = []
+    collector = HritFilesCollector(
+        hrit_files=DirectoryVisitor(parent_input_directory_path=tmpdir, visitor_callback=visited.append)
+    )
+
+    assert collector.sorted_files is collector.sorted_files
+    assert Counter(visited) == Counter(files)
@@ -49,6 +49,19 @@ def test_generate_chimp_input_output_filename_from_product_id_and_datetime(prefi
         assert expected_filenames[i] == func(attr)
 
 
+@pytest.mark.parametrize("func", [
+    input_filename_from_product_id,
+    output_filename_from_product_id,
+    input_filename_from_datetime,
+    output_filename_from_datetime
+])
+def test_generate_chimp_input_output_filename_extension(func):
+    products_attr = tuple(products_attribute(func))
+    filenames = func(products_attr, extension=".nc4")
+    assert isinstance(filenames, tuple)
+    assert [f.suffix for f in filenames] == [".nc4", ".nc4"]
+
+
 def products_attribute(func):
     """Retrieve the desired the attribute based on the function name.
 
@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
@@ -15,7 +17,9 @@ from monkey_wrench.input_output import (
     FsSpecCache,
     Items,
     Reader,
+    TempDirectory,
     Writer,
+    _models,
 )
 from tests.utils import make_dummy_datetime_files, make_dummy_file, make_dummy_files
 
@@ -126,6 +130,52 @@ def test_DirectoryVisitor_pattern_in_path(temp_dir, pattern):
     assert set(files_visited) == files_expected
 
 
+@pytest.mark.parametrize("reverse", [True, False])
+@pytest.mark.parametrize("number_of_threads", [1, 4])
+def test_DirectoryVisitor_sorted_as_paths(temp_dir, reverse, number_of_threads):
+    os.mkdir(temp_dir / "dir")
+    os.mkdir(temp_dir / "dir.d")
+    files = [make_dummy_file(f) for f in [temp_dir / "dir/b", temp_dir / "dir-c", temp_dir / "dir.d/a"]]
+
+    files_visited = DirectoryVisitor(
+        parent_input_directory_path=temp_dir, reverse=reverse, number_of_threads=number_of_threads
+    ).visit()
+
+    assert files_visited == sorted(files, reverse=reverse)
+
+
+@pytest.mark.parametrize("recursive", [True, False])
+@pytest.mark.parametrize("number_of_threads", [1, 4])
+def test_DirectoryVisitor_unsorted(temp_dir, recursive, number_of_threads):
+    _, dummy_files = _make_dummy_datetime_files(temp_dir)
+    top_level_files, _, _ = make_dummy_files(temp_dir, prefix="top_level_files_2022.nc")
+    expected = top_level_files | (set(dummy_files) if recursive else set())
+
+    files = DirectoryVisitor(
+        parent_input_directory_path=temp_dir, recursive=recursive, sort=False, number_of_threads=number_of_threads
+    ).visit()
+
+    assert len(files) == len(expected)
+    assert set(files) == expected
+
+
+@pytest.mark.parametrize("recursive", [True, False])
+@pytest.mark.parametrize("number_of_threads", [1, 2])
+def test_DirectoryVisitor_symlink_to_directory(temp_dir, recursive, number_of_threads):
+    target = temp_dir / "target"
+    target.mkdir()
+    make_dummy_file(target / "file.nc")
+    make_dummy_file(temp_dir / "top_level_file.nc")
+    (temp_dir / "link").symlink_to(target, target_is_directory=True)
+
+    files = DirectoryVisitor(
+        parent_input_directory_path=temp_dir, recursive=recursive, number_of_threads=number_of_threads
+    ).visit()
+
+    expected = [target / "file.nc", temp_dir / "top_level_file.nc"] if recursive else [temp_dir / "top_level_file.nc"]
+    assert expected == files
+
+
 def test_DirectoryVisitor_callback(temp_dir):
     buff = []
     _, dummy_files = _make_dummy_datetime_files(temp_dir)
@@ -221,17 +271,146 @@ def test_compare_files_against_reference(dummy_and_reference_files_for_compariso
     assert [bool(i) for i in file_size_validator.verify_files()] == [False, False]
 
 
+@pytest.mark.parametrize("file_size_executor", ["thread", "process"])
+def test_compare_files_against_reference_executor(temp_dir, file_size_executor):
+    _, _, expected_corrupted = make_dummy_files(
+        temp_dir, number=10, nominal_size_in_bytes=1000, size_fluctuation_ratio=0.1, tolerance=0.05
+    )
+
+    _, corrupted = FilesIntegrityValidator(
+        filepaths=DirectoryVisitor(parent_input_directory_path=temp_dir),
+        nominal_file_size=1000,
+        file_size_relative_tolerance=0.05,
+        number_of_processes=2,
+        number_of_threads=2,
+        file_size_executor=file_size_executor
+    ).verify_files()
+
+    assert corrupted == expected_corrupted
+
+
+@pytest.mark.parametrize(("file_size", "expected"), [
+    (1000, False),
+    (950, False),
+    (1050, False),
+    (949, True),
+    (1051, True),
+    (0, True),
+])
+def test_file_is_corrupted(file_size, expected):
+    validator = FilesIntegrityValidator(filepaths=[], nominal_file_size=1000, file_size_relative_tolerance=0.05)
+    assert validator.file_is_corrupted(file_size) is expected
+
+
+@pytest.mark.parametrize(("file_size", "expected"), [
+    (71, False),
+    (70, True),
+    (129, False),
+    (130, True),
+])
+def test_file_is_corrupted_exact_threshold(temp_dir, file_size, expected):
+    # ``0.29 * 100`` is ``28.999999999999996`` in floating-point arithmetic, whereas the threshold must be ``29``.
+    filepath = temp_dir / "file.nc"
+    make_dummy_file(filepath, size_in_bytes=file_size)
+    validator = FilesIntegrityValidator(filepaths=[filepath], nominal_file_size=100, file_size_relative_tolerance=0.29)
+
+    assert validator.file_is_corrupted(file_size) is expected
+    assert ({filepath} if expected else set()) == validator.find_corrupted_files()
+
+
+@pytest.mark.parametrize("tolerance", [float("inf"), float("nan"), -0.1])
+def test_file_size_relative_tolerance_fail(tolerance):
+    with pytest.raises(ValidationError, match="file_size_relative_tolerance"):
+        FilesIntegrityValidator(filepaths=[], nominal_file_size=1000, file_size_relative_tolerance=tolerance)
+
 def test_compare_files_against_reference_transform(temp_dir):
     datetime_objs, collected_files = _make_dummy_datetime_files(temp_dir)
 
-    missing, _ = FilesIntegrityValidator(
-        reference=datetime_objs,
-        filepaths=collected_files,
-        filepath_transform_function=ChimpFilePathParser.parse
-    ).verify_files()
+    for transform_function in [ChimpFilePathParser.parse, ChimpFilePathParser]:
+        missing, _ = FilesIntegrityValidator(
+            reference=datetime_objs,
+            filepaths=collected_files[1:],
+            filepath_transform_function=transform_function
+        ).verify_files()
+
+        assert missing == {datetime_objs[0]}
+
+
+def test_compare_files_against_reference_as_arguments(temp_dir):
+    datetime_objs, collected_files = _make_dummy_datetime_files(temp_dir)
+    validator = FilesIntegrityValidator(filepaths=[], filepath_transform_function=ChimpFilePathParser.parse)
+    visitor = DirectoryVisitor(parent_input_directory_path=temp_dir, recursive=True)
+
+    assert validator.find_missing_files(visitor, datetime_objs) == set()
+    assert validator.find_missing_files(collected_files[1:], datetime_objs) == {datetime_objs[0]}
+
+
+def test_verify_files_visits_once(temp_dir):
+    files, _, _ = make_dummy_files(temp_dir, number=3, nominal_size_in_bytes=1000)
+    visited = []
+    visitor = DirectoryVisitor(parent_input_directory_path=temp_dir, visitor_callback=visited.append)
+
+    missing, corrupted = FilesIntegrityValidator(filepaths=[], nominal_file_size=1000).verify_files(visitor, files)
+
+    assert (missing, corrupted) == (set(), set())
+    assert sorted(visited) == sorted(files)
+
+
+@pytest.mark.parametrize("method", [
+    lambda validator, items: validator.find_corrupted_files(items),
+    lambda validator, items: validator.find_missing_files(items, ["x"]),
+    lambda validator, items: validator.find_missing_files(["x"], items),
+    lambda validator, items: validator.verify_files(items, ["x"]),
+])
+@pytest.mark.parametrize("items", [
+    lambda filepath: str(filepath),
+    lambda filepath: (filepath for _ in range(2)),
+])
+def test_verify_files_invalid_items(temp_dir, method, items):
+    filepath = temp_dir / "file.txt"
+    make_dummy_file(filepath, size_in_bytes=1000)
+    validator = FilesIntegrityValidator(filepaths=[], nominal_file_size=1000)
+
+    with pytest.raises(TypeError, match="Expected a list/set/tuple"):
+        method(validator, items(filepath))
 
-    assert missing == set()
+def test_reference_is_resolved_lazily(temp_dir):
+    files, _, _ = make_dummy_files(temp_dir, number=3, nominal_size_in_bytes=1000)
+    visited = []
+    visitor = DirectoryVisitor(parent_input_directory_path=temp_dir, visitor_callback=visited.append)
 
+    validator = FilesIntegrityValidator(filepaths=files, reference=visitor)
+    assert visited == []
+
+    assert validator.find_missing_files() == set()
+    assert validator.find_missing_files() == set()
+    assert sorted(visited) == sorted(files)
+    assert sorted(validator.reference) == sorted(files)
+
+
+def test_reference_new_with(temp_dir):
+    files, _, _ = make_dummy_files(temp_dir, number=3, nominal_size_in_bytes=1000)
+    files = sorted(files)
+    validator = FilesIntegrityValidator(filepaths=files, reference=files[:1])
+
+    assert files[:1] == validator.reference
+    assert files[:2] == validator.new_with(reference=files[:2]).reference
+    assert files[:1] == validator.new_with(nominal_file_size=1000).reference
+
+
+def test_reference_model_copy(temp_dir):
+    files, _, _ = make_dummy_files(temp_dir, number=3, nominal_size_in_bytes=1000)
+    files = sorted(files)
+    validator = FilesIntegrityValidator(filepaths=files, reference=files[:1], nominal_file_size=1000)
+
+    assert files[:1] == validator.reference
+    assert validator.file_is_corrupted(1020)
+    assert files[:1] == validator.model_copy().reference
+
+    copied = validator.model_copy(update={"reference_source": files[:2], "file_size_relative_tolerance": 0.05})
+    assert files[:2] == copied.reference
+    assert not copied.file_is_corrupted(1020)
+    assert files[:1] == validator.reference
 
 @pytest.fixture
 def dummy_and_reference_files_for_comparison(temp_dir):
@@ -302,6 +481,111 @@ def test_write_to_file_and_read_from_file(temp_dir):
     assert {SeviriIDParser.parse(i) for i in product_ids} == set(read_ids_transformed)
 
 
+def _fail_on_b(item):
+    if item == "b":
+        raise KeyError(item)
+    return item
+
+
+@pytest.mark.parametrize("on_write_catch_exceptions", [None, (KeyError,), (LookupError, ValueError)])
+def test_Writer_catch_exceptions(temp_dir, on_write_catch_exceptions):
+    writer = Writer(
+        output_filepath=temp_dir / "output.txt",
+        on_write_catch_exceptions=on_write_catch_exceptions,
+        pre_writing_transformation=StringTransformation(transform_function=_fail_on_b)
+    )
+
+    assert 2 == writer.write(["a", "b", "c"])
+    assert ["a", "c"] == Reader(input_filepath=writer.output_filepath).read()
+
+
+@pytest.mark.parametrize("on_write_catch_exceptions", [(), (ValueError,)])
+def test_Writer_raise_exceptions(temp_dir, on_write_catch_exceptions):
+    writer = Writer(
+        output_filepath=temp_dir / "output.txt",
+        on_write_catch_exceptions=on_write_catch_exceptions,
+        pre_writing_transformation=StringTransformation(transform_function=_fail_on_b)
+    )
+
+    with pytest.raises(KeyError):
+        writer.write(["a", "b", "c"])
+    assert ["a"] == Reader(input_filepath=writer.output_filepath).read()
+
+
+def test_Writer_transform_items_once(temp_dir):
+    transformed = []
+
+    def transform(item):
+        transformed.append(item)
+        return _fail_on_b(item)
+
+    writer = Writer(
+        output_filepath=temp_dir / "output.txt",
+        pre_writing_transformation=StringTransformation(transform_function=transform)
+    )
+
+    assert 2 == writer.write(["a", "b", "c"])
+    assert ["a", "b", "c"] == transformed
+
+
+@pytest.mark.parametrize(("on_write_catch_exceptions", "raises"), [
+    (None, False),
+    ((OSError,), False),
+    ((), True),
+])
+def test_Writer_failed_write(temp_dir, monkeypatch, on_write_catch_exceptions, raises):
+    def fail(*_):
+        raise OSError("No space left on device.")
+
+    monkeypatch.setattr(_models, "_write_lines", fail)
+    writer = Writer(output_filepath=temp_dir / "output.txt", on_write_catch_exceptions=on_write_catch_exceptions)
+
+    if raises:
+        with pytest.raises(OSError, match="No space left"):
+            writer.write(["a", "b"])
+    else:
+        assert 0 == writer.write(["a", "b"])
+
+
+def test_Writer_write_in_batches_failed_batch(temp_dir):
+    def batches():
+        yield ["a", "b"], 2
+        yield ("c",), 1
+        raise RuntimeError("Failed to retrieve the batch.")
+
+    writer = Writer(output_filepath=temp_dir / "output.txt")
+    with pytest.raises(RuntimeError):
+        writer.write_in_batches(batches())
+
+    assert ["a", "b", "c"] == Reader(input_filepath=writer.output_filepath).read()
+
+
+@pytest.mark.parametrize("number_of_items", [0, 1, 4096, 10000])
+def test_Writer_many_items(temp_dir, number_of_items):
+    items = [str(i) for i in range(number_of_items)]
+    writer = Writer(output_filepath=temp_dir / "output.txt", write_buffer_size=16)
+
+    assert number_of_items == writer.write(items)
+    assert items == Reader(input_filepath=writer.output_filepath).read()
+
+
+@pytest.mark.parametrize(("trim", "expected"), [
+    (True, ["a", "b", "", "c\x0cd\u2028e"]),
+    (False, ["a\n", "b\n", "\n", "c\x0cd\u2028e"]),
+])
+@pytest.mark.parametrize("max_file_size_to_read_at_once", [1 << 30, 0])
+def test_Reader_lines(temp_dir, monkeypatch, trim, expected, max_file_size_to_read_at_once):
+    monkeypatch.setattr(_models, "MAX_FILE_SIZE_TO_READ_AT_ONCE", max_file_size_to_read_at_once)
+    filepath = temp_dir / "input.txt"
+    with open(filepath, "wb") as f:
+        f.write("a\r\nb\n\nc\x0cd\u2028e".encode())
+
+    reader = Reader(input_filepath=filepath, post_reading_transformation=StringTransformation(trim=trim))
+
+    assert expected == reader.read()
+    assert expected == list(reader.read_iter())
+
+
 def seviri_product_ids_file(path, idx):
     return path / Path(f"seviri_product_ids_{idx}.txt")
 
@@ -312,9 +596,12 @@ def seviri_product_ids_file(path, idx):
 @pytest.mark.parametrize("kwargs", [
     dict(format_string="%Y/%m/%d"),
     dict(format_string="%Y-%m/%d"),
+    dict(format_string="%Y/%m/%d/%H_%M"),
+    dict(format_string="%Y/%m/%d/%I%p"),
+    dict(format_string="%Y/%m/%d/%H%M%S"),
 ])
 def test_DateTimeDirectory(temp_dir, kwargs):
-    datetime_obj = datetime(2022, 3, 12)
+    datetime_obj = datetime(2022, 3, 12, 14, 27)
     datetime_directory = DateTimeDirectory(
         parent_output_directory_path=temp_dir,
         datetime_format_string=kwargs["format_string"]
@@ -340,20 +627,64 @@ def test_DateTimeDirectory_remove(temp_dir, create_dir):
     assert not Path(temp_dir / "2022/03/12/test").exists()
 
 
+def test_DateTimeDirectory_recreate_removed_directory(temp_dir):
+    datetime_directory = DateTimeDirectory(parent_output_directory_path=temp_dir)
+
+    dir_path = datetime_directory.create_datetime_directory(datetime(2022, 3, 12, 0, 12))
+    shutil.rmtree(dir_path)
+
+    assert dir_path == datetime_directory.create_datetime_directory(datetime(2022, 3, 12, 0, 27))
+    assert dir_path.exists()
+
+
 # ======================================================
 ### Tests for FsSpecCache()
 
 def test_FsSpecCache():
     assert FsSpecCache(fsspec_cache="filecache").fsspec_cache_str == "::filecache"
+    assert FsSpecCache(fsspec_cache="blockcache").fsspec_cache_str == "::blockcache"
     assert FsSpecCache().fsspec_cache_str == "::filecache"
 
 
 @pytest.mark.parametrize("fc", [
-    "blockcache",
+    "mmapcache",
     None,
     "",
     "invalid"
 ])
 def test_FsSpecCache_fail(fc):
-    with pytest.raises(ValidationError, match="Input should be 'filecache'"):
+    with pytest.raises(ValidationError, match="Input should be 'filecache' or 'blockcache'"):
         FsSpecCache(fsspec_cache=fc)
+
+
+# ======================================================
+### Tests for TempDirectory()
+
+@pytest.mark.parametrize("use_temp_directory_path", [True, False])
+def test_TempDirectory(temp_dir, use_temp_directory_path):
+    temp_directory_path = temp_dir if use_temp_directory_path else None
+    expected_parent = temp_dir if use_temp_directory_path else Path(tempfile.gettempdir())
+
+    with TempDirectory(temp_directory_path=temp_directory_path).make_temporary_directory("prefix_") as directory:
+        directory = Path(directory)
+        assert directory.is_dir()
+        assert directory.parent == expected_parent
+        assert directory.name.startswith("prefix_")
+        make_dummy_file(directory / "file.nc")
+
+    assert not directory.exists()
+
+
+def test_TempDirectory_different_instances(temp_dir):
+    first_parent, second_parent = temp_dir / "first", temp_dir / "second"
+    first_parent.mkdir()
+    second_parent.mkdir()
+    global_tempdir = tempfile.tempdir
+
+    with TempDirectory(temp_directory_path=first_parent).make_temporary_directory() as first:
+        with TempDirectory(temp_directory_path=second_parent).make_temporary_directory() as second:
+            assert Path(first).parent == first_parent
+            assert Path(second).parent == second_parent
+        assert not Path(second).exists()
+        assert Path(first).is_dir()
+    assert tempfile.tempdir == global_tempdir
@@ -0,0 +1,66 @@
+import os
+import signal
+
+import pytest
+from pydantic import ValidationError
+
+from monkey_wrench.process import MultiProcess
+
+
+def _square(x):
+    return x ** 2
+
+
+@pytest.mark.parametrize("number_of_processes", [1, 2])
+def test_run_with_results_preserves_order(number_of_processes):
+    arguments = list(range(20))
+    results = MultiProcess(number_of_processes=number_of_processes).run_with_results(_square, arguments)
+    assert [x ** 2 for x in arguments] == results
+
+
+@pytest.mark.parametrize("number_of_processes", [1, 2])
+def test_run_with_results_set(number_of_processes):
+    arguments = set(range(20))
+    results = MultiProcess(number_of_processes=number_of_processes).run_with_results(_square, arguments)
+    assert {x ** 2 for x in arguments} == set(results)
+    assert len(arguments) == len(results)
+
+
+def test_run_with_results_reuse_pool():
+    with MultiProcess(number_of_processes=2) as multi_process:
+        assert [0, 1, 4] == multi_process.run_with_results(_square, [0, 1, 2])
+        pool = multi_process._pool
+        assert pool is not None
+        assert [9, 16] == multi_process.run_with_results(_square, [3, 4])
+        assert pool is multi_process._pool
+    assert multi_process._pool is None
+
+
+def _write(path):
+    if path.name == "fail":
+        raise ValueError("failed")
+    path.write_text(path.name)
+
+
+@pytest.mark.parametrize("number_of_processes", [1, 3])
+def test_run(temp_dir, number_of_processes):
+    filepaths = [temp_dir / name for name in ["a", "fail", "c"]]
+    MultiProcess(number_of_processes=number_of_processes).run(_write, filepaths)
+    assert {"a", "c"} == {path.read_text() for path in filepaths if path.exists()}
+
+
+def test_number_of_processes_must_be_positive():
+    with pytest.raises(ValidationError, match="greater than 0"):
+        MultiProcess(number_of_processes=0)
+
+
+def _kill_on_b(path):
+    if path.name == "b":
+        os.kill(os.getpid(), signal.SIGKILL)
+    path.write_text(path.name)
+
+
+def test_run_killed_worker(temp_dir):
+    filepaths = [temp_dir / name for name in ["a", "b", "c", "d", "e"]]
+    MultiProcess(number_of_processes=2).run(_kill_on_b, filepaths)
+    assert {"a", "c", "d", "e"} == {path.read_text() for path in filepaths if path.exists()}
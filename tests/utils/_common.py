@@ -1,11 +1,13 @@
 """The module which includes common functions used in testing."""
 
+import math
 import os
 import random
 import sys
 from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime, timedelta
+from fractions import Fraction
 from pathlib import Path
 from typing import Any, Callable, Iterable
 from unittest.mock import MagicMock, patch
@@ -247,9 +249,10 @@ def make_dummy_files(
             tolerance.
         tolerance:
             Maximum allowed relative difference in file size, before it can be marked as corrupted.
-            Any file whose size (``file_size``) satisfies ``abs(1 - file_size/nominal_size) > tolerance`` will be
-            marked as corrupted. Defaults to ``0.01``, i.e. any file with a size difference larger than 1 percent of
-            the expected size will be marked as corrupted.
+            Any file whose size (``file_size``) satisfies
+            ``abs(file_size - nominal_size) > tolerance * nominal_size`` (computed exactly) will be marked as corrupted.
+            Defaults to ``0.01``, i.e. any file with a size difference larger than 1 percent of the expected size will
+            be marked as corrupted.
         size_fluctuation_ratio:
             See the description of ``nominal_size_in_bytes`` and ``tolerance``. Defaults to ``None``, which means all
             files will have the same size of ``nominal_size_in_bytes``.
@@ -281,8 +284,9 @@ def make_dummy_files(
     )
 
     if size_fluctuation_ratio is not None:
+        threshold = math.floor(Fraction(str(tolerance)) * nominal_size_in_bytes)
         corrupted_files = {
-            f for f in available_files if abs(1 - f.stat().st_size / nominal_size_in_bytes) > tolerance
+            f for f in available_files if abs(f.stat().st_size - nominal_size_in_bytes) > threshold
         }
     else:
         corrupted_files = set()